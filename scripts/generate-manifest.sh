@@ -0,0 +1,79 @@
+#!/bin/bash
+set -e
+
+# AI Dev Foundry Manifest Generator
+# Regenerates ai-configs.manifest, the list of files distributed by
+# manage-ai-configs.sh with their SHA-256 and size. Clients use it to
+# download only the files that changed.
+#
+# Source: https://github.com/amulya-labs/ai-dev-foundry
+# License: MIT (https://opensource.org/licenses/MIT)
+#
+# Usage:
+#   ./scripts/generate-manifest.sh           # Rewrite ai-configs.manifest
+#   ./scripts/generate-manifest.sh --check   # Fail if ai-configs.manifest is stale
+
+MANIFEST_FILE="ai-configs.manifest"
+
+# Tracked paths distributed by manage-ai-configs.sh
+DISTRIBUTED_PATHS=(
+    .claude/agents
+    .claude/hooks
+    .claude/settings.json
+    .github/workflows/claude.yml
+    .github/workflows/claude-code-review.yml
+    .github/workflows/gemini-code-review.yml
+)
+
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+NC='\033[0m'
+
+info() { echo -e "${GREEN}==>${NC} $1"; }
+error() { echo -e "${RED}==>${NC} $1"; exit 1; }
+
+sha256_file() {
+    if command -v sha256sum > /dev/null 2>&1; then
+        sha256sum -- "$1" | cut -d' ' -f1
+    else
+        shasum -a 256 -- "$1" | cut -d' ' -f1
+    fi
+}
+
+# Print the manifest ("<sha> <size> <path>" per line, sorted by path)
+generate() {
+    echo "# Generated by scripts/generate-manifest.sh — do not edit"
+    echo "# Format: sha256 size path"
+    git ls-files -- "${DISTRIBUTED_PATHS[@]}" | LC_ALL=C sort | while IFS= read -r path; do
+        echo "$(sha256_file "$path") $(wc -c < "$path" | tr -d ' ') $path"
+    done
+}
+
+if ! git rev-parse --is-inside-work-tree > /dev/null 2>&1; then
+    error "Not inside a git repository"
+fi
+cd "$(git rev-parse --show-toplevel)"
+
+# A manifest without agents or hooks would make every client skip them
+for required in .claude/agents .claude/hooks; do
+    if [[ -z "$(git ls-files -- "$required")" ]]; then
+        error "No tracked files under $required — run from a full checkout"
+    fi
+done
+
+case "${1:-}" in
+    --check)
+        if ! diff -u "$MANIFEST_FILE" <(generate); then
+            error "$MANIFEST_FILE is out of date. Run scripts/generate-manifest.sh and commit the result."
+        fi
+        info "$MANIFEST_FILE is up to date"
+        ;;
+    "")
+        generate > "$MANIFEST_FILE"
+        info "Wrote $MANIFEST_FILE"
+        ;;
+    *)
+        echo "Usage: $0 [--check]"
+        exit 1
+        ;;
+esac
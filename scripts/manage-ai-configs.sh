@@ -12,6 +12,7 @@ set -e
 #   ./scripts/manage-ai-configs.sh claude install --with-gha-workflows   # Also install extra workflow templates
 #   ./scripts/manage-ai-configs.sh claude update                         # Pull latest config (includes Claude workflows)
 #   ./scripts/manage-ai-configs.sh claude update --with-gha-workflows    # Update including extra workflow templates
+#   ./scripts/manage-ai-configs.sh claude update --archive               # Fetch changed files from one tarball
 #
 # Multi-provider usage (comma-separated or individual flags):
 #   ./scripts/manage-ai-configs.sh claude install --gemini               # Claude + Gemini workflows
@@ -21,9 +22,14 @@ set -e
 REPO="amulya-labs/ai-dev-foundry"
 BRANCH="main"
 CLAUDE_DIR=".claude"
-API_BASE="https://api.github.com/repos/$REPO/contents"
-RAW_BASE="https://raw.githubusercontent.com/$REPO/$BRANCH"
+# Endpoints can be overridden from the environment (e.g. a local HTTP server for testing)
+API_BASE="${API_BASE:-https://api.github.com/repos/$REPO/contents}"
+RAW_BASE="${RAW_BASE:-https://raw.githubusercontent.com/$REPO/$BRANCH}"
+ARCHIVE_URL="${ARCHIVE_URL:-https://codeload.github.com/$REPO/tar.gz/refs/heads/$BRANCH}"
+MANIFEST_FILE="ai-configs.manifest"
 WITH_GHA_WORKFLOWS=false
+USE_ARCHIVE=false
+MAX_JOBS="${MAX_JOBS:-8}"
 
 # Provider flags — set by --ai / --gemini flags (claude is always implied by the positional arg)
 PROVIDER_GEMINI=false
@@ -98,14 +104,159 @@ download_dir() {
     fi
 }
 
+# Print SHA-256 and path ("<sha>  <path>") for each file given
+sha256_files() {
+    if command -v sha256sum > /dev/null 2>&1; then
+        sha256sum -- "$@"
+    else
+        shasum -a 256 -- "$@"
+    fi
+}
+
+# Print the manifest entries ("<sha> <size> <path>") this install needs
+select_manifest_entries() {
+    local manifest="$1"
+    local sha size path
+
+    while read -r sha size path; do
+        case "$sha" in ''|\#*) continue ;; esac
+        # Never write outside the repo: reject absolute paths and .. segments
+        case "/$path/" in
+            //*|*/../*)
+                warn "  Skipping unsafe manifest path: $path" >&2
+                continue
+                ;;
+        esac
+        case "$path" in
+            .claude/agents/*|.claude/hooks/*|.claude/settings.json) ;;
+            .github/workflows/claude.yml|.github/workflows/claude-code-review.yml) ;;
+            .github/workflows/gemini-code-review.yml) $PROVIDER_GEMINI || continue ;;
+            *) continue ;;
+        esac
+        echo "$sha $size $path"
+    done < "$manifest"
+}
+
+# Download files listed in the published manifest, skipping any whose local
+# copy already has the same hash. Downloads run up to $MAX_JOBS at a time, or
+# come from a single tarball with --archive. Every file is hash-checked before
+# it replaces the local copy.
+# Returns 1 if no manifest is published, so callers can fall back.
+download_from_manifest() {
+    local tmp
+    tmp=$(mktemp -d)
+
+    info "Fetching manifest..."
+    if ! curl -fsSL "$RAW_BASE/$MANIFEST_FILE" -o "$tmp/manifest" 2>/dev/null; then
+        warn "  $MANIFEST_FILE not available; downloading file by file"
+        rm -rf "$tmp"
+        return 1
+    fi
+
+    select_manifest_entries "$tmp/manifest" > "$tmp/wanted"
+
+    # A manifest missing agents or hooks is incomplete; don't trust it
+    if ! grep -q ' \.claude/agents/' "$tmp/wanted" || ! grep -q ' \.claude/hooks/' "$tmp/wanted"; then
+        warn "  $MANIFEST_FILE lists no agents or hooks; downloading file by file"
+        rm -rf "$tmp"
+        return 1
+    fi
+
+    # Hash the local copies we already have in one pass
+    local existing=()
+    local sha size path
+    while read -r sha size path; do
+        if [ -f "$path" ]; then
+            existing+=("$path")
+        fi
+    done < "$tmp/wanted"
+    : > "$tmp/local"
+    if [ ${#existing[@]} -gt 0 ]; then
+        sha256_files "${existing[@]}" > "$tmp/local"
+    fi
+
+    # Keep only entries whose hash differs from the local copy
+    awk 'FILENAME == ARGV[1] { have[$1 " " $2] = 1; next } !(($1 " " $3) in have)' \
+        "$tmp/local" "$tmp/wanted" > "$tmp/changed"
+
+    local total changed
+    total=$(wc -l < "$tmp/wanted" | tr -d ' ')
+    changed=$(wc -l < "$tmp/changed" | tr -d ' ')
+    info "  $changed of $total files changed"
+
+    if [ "$changed" -gt 0 ]; then
+        mkdir -p "$tmp/files"
+        if $USE_ARCHIVE; then
+            info "Fetching archive..."
+            mkdir -p "$tmp/archive"
+            if ! curl -fsSL "$ARCHIVE_URL" 2>/dev/null | tar -xzf - -C "$tmp/archive" --strip-components=1; then
+                warn "  Failed to download archive"
+            fi
+            while read -r sha size path; do
+                if [ -f "$tmp/archive/$path" ]; then
+                    mkdir -p "$(dirname "$tmp/files/$path")"
+                    cp "$tmp/archive/$path" "$tmp/files/$path"
+                fi
+            done < "$tmp/changed"
+        else
+            # shellcheck disable=SC2016
+            cut -d' ' -f3- "$tmp/changed" | tr '\n' '\0' |
+                xargs -0 -n 1 -P "$MAX_JOBS" sh -c \
+                    'mkdir -p "$(dirname "$2/$3")" && curl -fsSL "$1/$3" -o "$2/$3" 2>/dev/null || true' \
+                    _ "$RAW_BASE" "$tmp/files"
+        fi
+
+        # Verify against the manifest before replacing local copies
+        local success=0
+        local failed=0
+        while read -r sha size path; do
+            local staged="$tmp/files/$path"
+            if [ -f "$staged" ] && [ "$(sha256_files "$staged" | cut -d' ' -f1)" = "$sha" ]; then
+                mkdir -p "$(dirname "$path")"
+                mv "$staged" "$path"
+                info "  Downloaded $path"
+                ((++success))
+            else
+                warn "  Failed to download $path"
+                ((++failed))
+            fi
+        done < "$tmp/changed"
+
+        echo "  $success files downloaded"
+        if [ $failed -gt 0 ]; then
+            warn "  $failed files failed"
+        fi
+    fi
+
+    rm -rf "$tmp"
+}
+
 download_all() {
     mkdir -p "$CLAUDE_DIR"
 
-    # Download agents
-    download_dir ".claude/agents" "$CLAUDE_DIR/agents"
+    if ! download_from_manifest; then
+        # Download agents
+        download_dir ".claude/agents" "$CLAUDE_DIR/agents"
 
-    # Download hooks
-    download_dir ".claude/hooks" "$CLAUDE_DIR/hooks"
+        # Download hooks
+        download_dir ".claude/hooks" "$CLAUDE_DIR/hooks"
+
+        # Download settings.json
+        info "Fetching settings.json..."
+        if curl -fsSL "$RAW_BASE/.claude/settings.json" -o "$CLAUDE_DIR/settings.json" 2>/dev/null; then
+            info "  Downloaded settings.json"
+        else
+            warn "  settings.json not found (optional)"
+        fi
+
+        # Always download Claude workflows
+        download_gha_workflows
+
+        # Download Gemini workflows if requested
+        if $PROVIDER_GEMINI; then
+            download_gha_gemini_workflows
+        fi
+    fi
 
     # Make hook scripts executable
     if [ -d "$CLAUDE_DIR/hooks" ]; then
@@ -113,22 +264,6 @@ download_all() {
         chmod +x "$CLAUDE_DIR/hooks/"*.py 2>/dev/null || true
     fi
 
-    # Download settings.json
-    info "Fetching settings.json..."
-    if curl -fsSL "$RAW_BASE/.claude/settings.json" -o "$CLAUDE_DIR/settings.json" 2>/dev/null; then
-        info "  Downloaded settings.json"
-    else
-        warn "  settings.json not found (optional)"
-    fi
-
-    # Always download Claude workflows
-    download_gha_workflows
-
-    # Download Gemini workflows if requested
-    if $PROVIDER_GEMINI; then
-        download_gha_gemini_workflows
-    fi
-
     # Optionally download extra workflow templates
     if $WITH_GHA_WORKFLOWS; then
         download_gha_workflow_templates
@@ -246,6 +381,9 @@ usage_claude() {
     echo "  --ai <providers>       Comma-separated provider list (e.g. claude,gemini)"
     echo "  --with-gha-workflows   Also install extra workflow templates from"
     echo "                         github-workflow-templates/ in the source repo"
+    echo "  --archive              Fetch changed files from one tarball instead of"
+    echo "                         one request per file"
+    echo "  --jobs=<n>             Concurrent downloads (default: 8)"
     echo ""
     echo "This downloads:"
     echo "  .claude/agents/   - Reusable Claude Code agents"
@@ -259,6 +397,9 @@ usage_claude() {
     echo "  .github/workflows/gemini-code-review.yml - Gemini PR review (Flash + Pro)"
     echo "  (requires GEMINI_API_KEY secret in repo)"
     echo ""
+    echo "Only files whose SHA-256 differs from the published $MANIFEST_FILE"
+    echo "are downloaded; unchanged files are left as they are."
+    echo ""
     echo "With --with-gha-workflows, also downloads:"
     echo "  Extra workflow templates from github-workflow-templates/"
 }
@@ -285,6 +426,8 @@ for arg in "$@"; do
     case "$arg" in
         --with-gha-workflows) WITH_GHA_WORKFLOWS=true ;;
         --gemini)             PROVIDER_GEMINI=true ;;
+        --archive)            USE_ARCHIVE=true ;;
+        --jobs=*)             MAX_JOBS="${arg#--jobs=}" ;;
         --ai)
             # --ai requires the next argument; handle below via index tracking
             # We use a sentinel so the next iteration picks up the value
@@ -335,6 +478,10 @@ while [ $_i -lt ${#_args[@]} ]; do
 done
 set -- "${_final[@]+"${_final[@]}"}"
 
+if ! [[ "$MAX_JOBS" =~ ^[1-9][0-9]*$ ]]; then
+    error "--jobs must be a positive integer (got '$MAX_JOBS')"
+fi
+
 case "$AGENT" in
     claude)
         case "${1:-}" in
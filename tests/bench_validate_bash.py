@@ -0,0 +1,255 @@
+"""
+Benchmark suite for the Bash command validator.
+
+Times each pipeline stage and end-to-end validate_command over the real
+test-case corpus, plus synthetic stress inputs and cold hook latency
+through validate-bash.sh. Results are written as JSON; the run fails when
+any benchmark's median exceeds its budget in bench-budgets.toml.
+
+Usage:
+    python3 tests/bench_validate_bash.py [--output PATH] [--repeat N]
+                                         [--only NAME] [--skip-hook]
+
+Source: https://github.com/amulya-labs/ai-dev-foundry
+License: MIT (https://opensource.org/licenses/MIT)
+"""
+
+import argparse
+import importlib.util
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Python 3.11+ has tomllib built-in
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib  # type: ignore[no-redef]
+
+REPO_ROOT = Path(__file__).parent.parent
+HOOKS_DIR = REPO_ROOT / ".claude" / "hooks"
+HOOK_SCRIPT = HOOKS_DIR / "validate-bash.sh"
+CONFIG_PATH = HOOKS_DIR / "bash-patterns.toml"
+CASES_PATH = Path(__file__).parent / "bash-test-cases.toml"
+BUDGETS_PATH = Path(__file__).parent / "bench-budgets.toml"
+DEFAULT_OUTPUT = REPO_ROOT / "bench_output.txt"
+
+# Import validate-bash.py (hyphenated filename requires importlib)
+_spec = importlib.util.spec_from_file_location(
+    "validate_bash", HOOKS_DIR / "validate-bash.py"
+)
+validate_bash = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(validate_bash)
+
+
+# ── Inputs ────────────────────────────────────────────────────────────────────
+
+
+def load_corpus():
+    """Return every command from bash-test-cases.toml, in file order."""
+    with open(CASES_PATH, "rb") as f:
+        data = tomllib.load(f)
+    return [
+        case["command"]
+        for category in ("allow", "ask", "deny")
+        for case in data.get(category, [])
+    ]
+
+
+def load_patterns():
+    """Load and compile the pattern configuration."""
+    with open(CONFIG_PATH, "rb") as f:
+        config = tomllib.load(f)
+    return (
+        validate_bash.compile_patterns(config, "deny"),
+        validate_bash.compile_patterns(config, "ask"),
+        validate_bash.compile_patterns(config, "allow"),
+    )
+
+
+def stress_inputs():
+    """Synthetic worst-case commands, keyed by benchmark name."""
+    heredoc_body = "line of heredoc content && not a command; | really\n" * 40_000
+    # Each level escapes backslashes, then quotes, so bash really unwraps it.
+    # Backslashes double per level; 10 levels stay around 2 KB.
+    nested = "echo hi"
+    for _ in range(10):
+        escaped = nested.replace("\\", "\\\\").replace('"', '\\"')
+        nested = f'bash -c "{escaped}"'
+    return {
+        "stress.and_chain_1000": " && ".join(["git status"] * 1000),
+        "stress.heredoc_2mb": f"cat <<'EOF' > out.txt\n{heredoc_body}EOF",
+        "stress.nested_quotes": nested,
+        "stress.bash_c": 'bash -c "git log --oneline -n 20"',
+    }
+
+
+# ── Timing ────────────────────────────────────────────────────────────────────
+
+
+def measure(fn, repeat):
+    """Run fn repeat times and return per-run wall times in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def build_benchmarks(corpus, patterns):
+    """Return an ordered mapping of benchmark name -> zero-arg callable."""
+    deny, ask, allow = patterns
+
+    # Precompute each stage's input so each stage.* benchmark times only its
+    # own stage (stage.validate_segment is the exception, see below).
+    segments = [seg for cmd in corpus for seg in validate_bash.split_commands(cmd)]
+    cleaned = [validate_bash.clean_segment(seg) for seg in segments]
+    cleaned = [seg for seg in cleaned if seg]
+    assignments = [validate_bash.extract_assignments(seg) for seg in cleaned]
+
+    def run_split():
+        for cmd in corpus:
+            validate_bash.split_commands(cmd)
+
+    def run_clean():
+        for seg in segments:
+            validate_bash.clean_segment(seg)
+
+    def run_extract():
+        for seg in cleaned:
+            validate_bash.extract_assignments(seg)
+
+    def run_substitute():
+        for seg, env in zip(cleaned, assignments):
+            validate_bash.substitute_known_vars(seg, env)
+
+    # Matching is not exposed on its own, so this times validate_command on
+    # each pre-cleaned segment: matching plus the split and clean it repeats
+    # per segment. Subtract the stage.* timings above to estimate matching.
+    def run_validate_segment():
+        for seg in cleaned:
+            validate_bash.validate_command(seg, deny, ask, allow)
+
+    def run_validate():
+        for cmd in corpus:
+            validate_bash.validate_command(cmd, deny, ask, allow)
+
+    benchmarks = {
+        "stage.split_commands": run_split,
+        "stage.clean_segment": run_clean,
+        "stage.extract_assignments": run_extract,
+        "stage.substitute_known_vars": run_substitute,
+        "stage.validate_segment": run_validate_segment,
+        "e2e.validate_command": run_validate,
+    }
+    for name, cmd in stress_inputs().items():
+        benchmarks[name] = (
+            lambda c=cmd: validate_bash.validate_command(c, deny, ask, allow)
+        )
+    return benchmarks
+
+
+def hook_benchmark():
+    """Return a callable running validate-bash.sh once, or None if unavailable."""
+    if not HOOK_SCRIPT.is_file() or shutil.which("jq") is None:
+        return None
+    payload = json.dumps({"tool_input": {"command": "git status"}}).encode()
+
+    def run_hook():
+        subprocess.run(
+            ["bash", str(HOOK_SCRIPT)],
+            input=payload,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+
+    return run_hook
+
+
+# ── Main ──────────────────────────────────────────────────────────────────────
+
+
+def positive_int(value):
+    """argparse type: an integer of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT,
+                        help=f"JSON results file (default: {DEFAULT_OUTPUT.name})")
+    parser.add_argument("--budgets", type=Path, default=BUDGETS_PATH,
+                        help="TOML file of per-benchmark budgets in ms")
+    parser.add_argument("--repeat", type=positive_int, default=5,
+                        help="Runs per benchmark (default: 5)")
+    parser.add_argument("--only", action="append", default=[],
+                        help="Run only benchmarks whose name starts with this (repeatable)")
+    parser.add_argument("--skip-hook", action="store_true",
+                        help="Skip cold hook latency through validate-bash.sh")
+    args = parser.parse_args(argv)
+
+    with open(args.budgets, "rb") as f:
+        budgets = tomllib.load(f).get("budgets_ms", {})
+
+    benchmarks = build_benchmarks(load_corpus(), load_patterns())
+    if not args.skip_hook:
+        run_hook = hook_benchmark()
+        if run_hook is None:
+            print("  (validate-bash.sh or jq not available — skipping hook.cold)")
+        else:
+            benchmarks["hook.cold"] = run_hook
+
+    if args.only:
+        benchmarks = {
+            name: fn for name, fn in benchmarks.items()
+            if any(name.startswith(prefix) for prefix in args.only)
+        }
+
+    results = {}
+    over_budget = []
+    for name, fn in benchmarks.items():
+        times = measure(fn, args.repeat)
+        median = statistics.median(times)
+        budget = budgets.get(name)
+        ok = budget is None or median <= budget
+        results[name] = {
+            "median_ms": round(median, 3),
+            "min_ms": round(min(times), 3),
+            "max_ms": round(max(times), 3),
+            "runs": len(times),
+            "budget_ms": budget,
+            "ok": ok,
+        }
+        if not ok:
+            over_budget.append(name)
+        status = "ok" if ok else "OVER BUDGET"
+        budget_str = f"{budget:>9.1f}" if budget is not None else "        -"
+        print(f"  {name:<30} {median:>9.3f} ms  budget {budget_str} ms  {status}")
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"\nResults written to {args.output}")
+
+    if over_budget:
+        print(f"{len(over_budget)} benchmark(s) over budget: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
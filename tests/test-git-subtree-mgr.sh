@@ -0,0 +1,219 @@
+#!/bin/bash
+# Tests for git-subtree-mgr — split caching and pulls against local upstreams.
+#
+# Source: https://github.com/amulya-labs/ai-dev-foundry
+# License: MIT (https://opensource.org/licenses/MIT)
+
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+REPO_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+MGR="$REPO_ROOT/scripts/git-subtree-mgr"
+
+PASS=0
+FAIL=0
+ERRORS=()
+
+if [[ -t 1 ]]; then
+    GREEN='\033[0;32m'
+    RED='\033[0;31m'
+    NC='\033[0m'
+else
+    GREEN=''
+    RED=''
+    NC=''
+fi
+
+assert() {
+    local desc="$1"
+    local result="$2"  # "pass" or "fail"
+    local detail="${3:-}"
+
+    if [[ "$result" == "pass" ]]; then
+        echo -e "  ${GREEN}✓${NC} $desc"
+        PASS=$((PASS + 1))
+    else
+        echo -e "  ${RED}✗${NC} $desc"
+        [[ -n "$detail" ]] && echo "    $detail"
+        ERRORS+=("$desc")
+        FAIL=$((FAIL + 1))
+    fi
+}
+
+# Probe the command itself; "git subtree --help" needs a man page
+if [[ ! -x "$(git --exec-path)/git-subtree" ]]; then
+    echo -e "${RED}git subtree not found in $(git --exec-path)${NC}"
+    exit 1
+fi
+
+# ── Sandbox: isolated git config, cache and local upstreams ────────
+
+TMP=$(mktemp -d)
+trap 'rm -rf "$TMP"' EXIT
+
+export XDG_CACHE_HOME="$TMP/cache"
+export GIT_CONFIG_GLOBAL="$TMP/gitconfig"
+export GIT_CONFIG_NOSYSTEM=1
+git config --global user.name "Test"
+git config --global user.email "test@example.com"
+git config --global init.defaultBranch main
+# --repo=local/<name> resolves to https://github.com/local/<name>; serve it from disk
+git config --global url."file://$TMP/upstream/".insteadOf "https://github.com/local/"
+
+UP="$TMP/upstream/up"
+git init -q "$UP"
+upstream_commit() {
+    local file="$1"
+    local content="$2"
+    mkdir -p "$UP/$(dirname "$file")"
+    echo "$content" > "$UP/$file"
+    git -C "$UP" add -A
+    git -C "$UP" commit -q -m "Update $file"
+}
+for n in 1 2 3; do
+    upstream_commit a-b/f "DASH $n"
+    upstream_commit a_b/f "UNDER $n"
+    upstream_commit sub/f "SUB $n"
+    upstream_commit other/f "OTHER $n"
+done
+
+MAIN="$TMP/main"
+git init -q "$MAIN"
+git -C "$MAIN" commit -q --allow-empty -m "Initial commit"
+
+mgr() {
+    (cd "$MAIN" && bash "$MGR" "$@" 2>&1)
+}
+
+# The split recorded in the latest squash commit for a prefix
+squashed_split() {
+    git -C "$MAIN" log -1 --grep="^git-subtree-dir: $1\$" --format=%B |
+        sed -n 's/^git-subtree-split: //p'
+}
+
+# ── Split cache keys ───────────────────────────────────────────────
+
+echo "=== Split cache keys ==="
+
+mgr add --prefix=v/dash --repo=local/up --path=a-b > /dev/null
+git -C "$MAIN" commit -q -m "Add v/dash"
+output=$(mgr add --prefix=v/under --repo=local/up --path=a_b)
+git -C "$MAIN" commit -q -m "Add v/under"
+
+if [[ "$(cat "$MAIN/v/under/f")" == "UNDER 3" ]] && [[ "$(cat "$MAIN/v/dash/f")" == "DASH 3" ]]; then
+    assert "paths that differ only in punctuation get separate split caches" "pass"
+else
+    assert "paths that differ only in punctuation get separate split caches" "fail" "$output"
+fi
+
+echo
+
+# ── Incremental split ──────────────────────────────────────────────
+
+echo "=== Incremental split ==="
+
+mgr add --prefix=v/sub --repo=local/up --path=sub > /dev/null
+git -C "$MAIN" commit -q -m "Add v/sub"
+
+output=$(mgr pull v/sub)
+if echo "$output" | grep -q "Split cache is up to date"; then
+    assert "pull with no upstream change reuses the cached split" "pass"
+else
+    assert "pull with no upstream change reuses the cached split" "fail" "$output"
+fi
+
+upstream_commit sub/f "SUB 4"
+upstream_commit other/f "OTHER 4"
+upstream_commit sub/g "SUB 5"
+
+output=$(mgr pull v/sub)
+if echo "$output" | grep -q "Splitting new upstream commits only"; then
+    assert "pull after upstream commits splits only the new ones" "pass"
+else
+    assert "pull after upstream commits splits only the new ones" "fail" "$output"
+fi
+
+full_split=$(git -C "$UP" subtree split --prefix=sub HEAD 2> /dev/null)
+if [[ -n "$full_split" ]] && [[ "$(squashed_split v/sub)" == "$full_split" ]]; then
+    assert "incremental split SHA equals full split SHA" "pass"
+else
+    assert "incremental split SHA equals full split SHA" "fail" \
+        "incremental: $(squashed_split v/sub), full: $full_split"
+fi
+
+if [[ "$(cat "$MAIN/v/sub/g")" == "SUB 5" ]]; then
+    assert "pull applies the new upstream content" "pass"
+else
+    assert "pull applies the new upstream content" "fail"
+fi
+
+echo
+
+# ── Parallel pull ──────────────────────────────────────────────────
+
+echo "=== Parallel pull ==="
+
+mgr add --prefix=v/all --repo=local/up > /dev/null
+git -C "$MAIN" commit -q -m "Add v/all"
+upstream_commit sub/h "SUB 6"
+
+output=$(GIT_TRACE="$TMP/trace" mgr pull --jobs=2) || true
+if [[ "$(cat "$MAIN/v/sub/h" 2>/dev/null)" == "SUB 6" ]] && \
+   [[ "$(cat "$MAIN/v/all/sub/h" 2>/dev/null)" == "SUB 6" ]]; then
+    assert "parallel pull updates subtree and whole-repo prefixes" "pass"
+else
+    assert "parallel pull updates subtree and whole-repo prefixes" "fail" "$output"
+fi
+
+# One fetch from upstream for the whole group; the whole-repo prefix
+# reads from the cache that fetch just refreshed
+upstream_fetches=$(grep -c "run_command:.*upload-pack.*$UP" "$TMP/trace" || true)
+if [[ "$upstream_fetches" -eq 1 ]]; then
+    assert "whole-repo prefix fetches from the group's cache" "pass"
+else
+    assert "whole-repo prefix fetches from the group's cache" "fail" \
+        "$upstream_fetches fetches from $UP"
+fi
+
+# Repos whose names differ only in punctuation need separate caches, or
+# parallel groups would fetch, check out and split in the same clone
+for name in my-lib my_lib; do
+    git init -q "$TMP/upstream/$name"
+    mkdir -p "$TMP/upstream/$name/lib"
+    echo "$name 1" > "$TMP/upstream/$name/lib/f"
+    git -C "$TMP/upstream/$name" add -A
+    git -C "$TMP/upstream/$name" commit -q -m "Initial $name"
+    mgr add --prefix="v/$name" --repo="local/$name" --path=lib > /dev/null
+    git -C "$MAIN" commit -q -m "Add v/$name"
+done
+for name in my-lib my_lib; do
+    echo "$name 2" > "$TMP/upstream/$name/lib/f"
+    git -C "$TMP/upstream/$name" commit -q -am "Update $name"
+done
+
+output=$(mgr pull --jobs=4) || true
+if [[ "$(cat "$MAIN/v/my-lib/f")" == "my-lib 2" ]] && \
+   [[ "$(cat "$MAIN/v/my_lib/f")" == "my_lib 2" ]]; then
+    assert "repos differing only in punctuation get separate caches" "pass"
+else
+    assert "repos differing only in punctuation get separate caches" "fail" "$output"
+fi
+
+echo
+
+# ── Summary ─────────────────────────────────────────────────────────
+
+echo "=== Summary ==="
+echo -e "Passed: ${GREEN}$PASS${NC}"
+echo -e "Failed: ${RED}$FAIL${NC}"
+
+if [[ $FAIL -gt 0 ]]; then
+    echo
+    echo "Failures:"
+    for err in "${ERRORS[@]}"; do
+        echo "  - $err"
+    done
+    exit 1
+fi
+
+echo -e "\n${GREEN}All tests passed!${NC}"
@@ -109,6 +109,16 @@ else
         "Found stale download_workflows() definition"
 fi
 
+# --jobs must be a positive integer; reject before any download starts
+for jobs in 0 -1 abc 4x ""; do
+    if ! output=$(bash "$MANAGE_SCRIPT" claude install --jobs="$jobs" 2>&1) && \
+       echo "$output" | grep -q "must be a positive integer"; then
+        assert "--jobs=$jobs is rejected" "pass"
+    else
+        assert "--jobs=$jobs is rejected" "fail" "$output"
+    fi
+done
+
 echo
 
 # ── download_gha_workflows explicit file downloads ──────────────────
@@ -137,16 +147,26 @@ echo
 
 echo "=== download_all() behavior ==="
 
-# download_gha_workflows should be called unconditionally (not inside an if $WITH_GHA_WORKFLOWS block)
-# Extract the download_all() body and verify the call appears outside any conditional block
+# Claude workflows are always installed: the manifest path selects them
+# unconditionally, and the per-file fallback calls download_gha_workflows
+# outside any if $WITH_GHA_WORKFLOWS block
+select_body=$(sed -n '/^select_manifest_entries()/,/^}/p' "$MANAGE_SCRIPT")
+if echo "$select_body" | grep -q '\.github/workflows/claude\.yml|\.github/workflows/claude-code-review\.yml) ;;'; then
+    assert "Claude workflows are always selected from the manifest" "pass"
+else
+    assert "Claude workflows are always selected from the manifest" "fail" \
+        "select_manifest_entries should accept claude.yml and claude-code-review.yml unconditionally"
+fi
+
 download_all_body=$(sed -n '/^download_all()/,/^}/p' "$MANAGE_SCRIPT")
+fallback_block=$(echo "$download_all_body" | sed -n '/if ! download_from_manifest/,/^    fi/p')
 conditional_block=$(echo "$download_all_body" | sed -n '/if \$WITH_GHA_WORKFLOWS/,/fi/p')
-if echo "$download_all_body" | grep -q 'download_gha_workflows$' && \
+if echo "$fallback_block" | grep -q 'download_gha_workflows$' && \
    ! echo "$conditional_block" | grep -q 'download_gha_workflows$'; then
-    assert "download_gha_workflows is called unconditionally in download_all()" "pass"
+    assert "download_gha_workflows is called unconditionally in the download_all() fallback" "pass"
 else
-    assert "download_gha_workflows is called unconditionally in download_all()" "fail" \
-        "download_gha_workflows should not be inside an if \$WITH_GHA_WORKFLOWS block"
+    assert "download_gha_workflows is called unconditionally in the download_all() fallback" "fail" \
+        "download_gha_workflows should run when the manifest is unavailable, outside any if \$WITH_GHA_WORKFLOWS block"
 fi
 
 # download_gha_workflow_templates should be called conditionally
@@ -215,6 +235,175 @@ fi
 
 echo
 
+# ── Manifest-based sync against a local HTTP stand-in ───────────────
+
+echo "=== Manifest-based incremental sync ==="
+
+if command -v python3 &>/dev/null && command -v curl &>/dev/null; then
+    SYNC_TMP=$(mktemp -d)
+    SERVER_PID=""
+    trap '[[ -n "$SERVER_PID" ]] && kill "$SERVER_PID" 2>/dev/null; rm -rf "$SYNC_TMP"' EXIT
+
+    # Fake upstream: a git repo served over HTTP as both RAW_BASE and archive
+    SRC="$SYNC_TMP/src"
+    mkdir -p "$SRC/.claude/agents" "$SRC/.claude/hooks" "$SRC/.github/workflows"
+    echo "agent one" > "$SRC/.claude/agents/one.md"
+    echo "agent two" > "$SRC/.claude/agents/two.md"
+    echo "echo hook" > "$SRC/.claude/hooks/hook.sh"
+    echo "{}" > "$SRC/.claude/settings.json"
+    echo "name: claude" > "$SRC/.github/workflows/claude.yml"
+    echo "name: review" > "$SRC/.github/workflows/claude-code-review.yml"
+    echo "name: ci" > "$SRC/.github/workflows/ci.yml"
+
+    publish_src() {
+        (
+            cd "$SRC"
+            git add -A
+            "$REPO_ROOT/scripts/generate-manifest.sh" > /dev/null
+            tar -czf "$SYNC_TMP/src.tar.gz" -C "$SYNC_TMP" --exclude=.git src
+        )
+    }
+    git -C "$SRC" init -q
+    publish_src
+
+    PORT=$(python3 -c 'import socket; s = socket.socket(); s.bind(("127.0.0.1", 0)); print(s.getsockname()[1])')
+    python3 -m http.server "$PORT" --bind 127.0.0.1 --directory "$SYNC_TMP" > /dev/null 2>&1 &
+    SERVER_PID=$!
+    for _ in $(seq 50); do
+        curl -fs "http://127.0.0.1:$PORT/src/ai-configs.manifest" > /dev/null 2>&1 && break
+        sleep 0.1
+    done
+
+    DEST="$SYNC_TMP/dest"
+    git init -q "$DEST"
+    run_manage() {
+        (cd "$DEST" && RAW_BASE="http://127.0.0.1:$PORT/src" \
+            API_BASE="http://127.0.0.1:$PORT/no-api" \
+            ARCHIVE_URL="http://127.0.0.1:$PORT/src.tar.gz" \
+            bash "$MANAGE_SCRIPT" claude "$@" 2>&1)
+    }
+
+    output=$(run_manage install) || true
+    if cmp -s "$SRC/.claude/agents/one.md" "$DEST/.claude/agents/one.md" && \
+       cmp -s "$SRC/.claude/settings.json" "$DEST/.claude/settings.json" && \
+       cmp -s "$SRC/.github/workflows/claude.yml" "$DEST/.github/workflows/claude.yml"; then
+        assert "install downloads all manifest files" "pass"
+    else
+        assert "install downloads all manifest files" "fail" "$output"
+    fi
+
+    if [[ ! -e "$DEST/.github/workflows/ci.yml" ]]; then
+        assert "install skips files not distributed to clients" "pass"
+    else
+        assert "install skips files not distributed to clients" "fail"
+    fi
+
+    if [[ -x "$DEST/.claude/hooks/hook.sh" ]]; then
+        assert "install makes hook scripts executable" "pass"
+    else
+        assert "install makes hook scripts executable" "fail"
+    fi
+
+    output=$(run_manage update) || true
+    if echo "$output" | grep -q "0 of 6 files changed" && ! echo "$output" | grep -q "Downloaded"; then
+        assert "update with no upstream change downloads nothing" "pass"
+    else
+        assert "update with no upstream change downloads nothing" "fail" "$output"
+    fi
+
+    echo "agent one v2" > "$SRC/.claude/agents/one.md"
+    publish_src
+    output=$(run_manage update) || true
+    if echo "$output" | grep -q "Downloaded .claude/agents/one.md" && \
+       ! echo "$output" | grep -q "Downloaded .claude/agents/two.md" && \
+       cmp -s "$SRC/.claude/agents/one.md" "$DEST/.claude/agents/one.md"; then
+        assert "update downloads only files whose hash changed" "pass"
+    else
+        assert "update downloads only files whose hash changed" "fail" "$output"
+    fi
+
+    echo "agent two v2" > "$SRC/.claude/agents/two.md"
+    publish_src
+    output=$(run_manage update --archive) || true
+    if echo "$output" | grep -q "Downloaded .claude/agents/two.md" && \
+       cmp -s "$SRC/.claude/agents/two.md" "$DEST/.claude/agents/two.md"; then
+        assert "update --archive applies changed files from the tarball" "pass"
+    else
+        assert "update --archive applies changed files from the tarball" "fail" "$output"
+    fi
+
+    # A file that does not match its manifest hash must not be installed
+    echo "agent two v3" > "$SRC/.claude/agents/two.md"
+    publish_src
+    echo "tampered" > "$SRC/.claude/agents/two.md"
+    output=$(run_manage update) || true
+    if echo "$output" | grep -q "Failed to download .claude/agents/two.md" && \
+       [[ "$(cat "$DEST/.claude/agents/two.md")" == "agent two v2" ]]; then
+        assert "update rejects files that fail the hash check" "pass"
+    else
+        assert "update rejects files that fail the hash check" "fail" "$output"
+    fi
+
+    # Manifest paths that climb out of the repo must never be written.
+    # curl collapses the .. in the URL to /escaped.txt; install into a
+    # nested repo so the traversal target differs from the served file.
+    publish_src
+    echo "escaped" > "$SYNC_TMP/escaped.txt"
+    escaped_sha=$(sha256sum "$SYNC_TMP/escaped.txt" | cut -d' ' -f1)
+    echo "$escaped_sha 8 .claude/hooks/../../../escaped.txt" >> "$SRC/ai-configs.manifest"
+    TRAVERSAL_DEST="$SYNC_TMP/deep/dest"
+    mkdir -p "$TRAVERSAL_DEST"
+    git init -q "$TRAVERSAL_DEST"
+    output=$(cd "$TRAVERSAL_DEST" && RAW_BASE="http://127.0.0.1:$PORT/src" \
+        API_BASE="http://127.0.0.1:$PORT/no-api" \
+        bash "$MANAGE_SCRIPT" claude install 2>&1) || true
+    if echo "$output" | grep -q "Skipping unsafe manifest path" && \
+       [[ ! -e "$SYNC_TMP/deep/escaped.txt" ]] && \
+       [[ -f "$TRAVERSAL_DEST/.claude/agents/one.md" ]]; then
+        assert "install skips manifest paths with .. segments" "pass"
+    else
+        assert "install skips manifest paths with .. segments" "fail" "$output"
+    fi
+
+    # A tree without agents or hooks must not produce a manifest
+    PARTIAL="$SYNC_TMP/partial"
+    mkdir -p "$PARTIAL/.github/workflows"
+    cp "$SRC/.github/workflows/claude.yml" "$SRC/.github/workflows/claude-code-review.yml" \
+        "$PARTIAL/.github/workflows/"
+    git -C "$PARTIAL" init -q
+    git -C "$PARTIAL" add -A
+    if ! (cd "$PARTIAL" && "$REPO_ROOT/scripts/generate-manifest.sh" > /dev/null 2>&1) && \
+       [[ ! -e "$PARTIAL/ai-configs.manifest" ]]; then
+        assert "generate-manifest.sh refuses a tree without agents or hooks" "pass"
+    else
+        assert "generate-manifest.sh refuses a tree without agents or hooks" "fail"
+    fi
+
+    # An incomplete manifest is ignored in favour of the per-file download
+    grep '\.github/' "$SRC/ai-configs.manifest" > "$SRC/ai-configs.manifest.tmp"
+    mv "$SRC/ai-configs.manifest.tmp" "$SRC/ai-configs.manifest"
+    mkdir -p "$SYNC_TMP/api/.claude"
+    echo '[{"name": "one.md"}, {"name": "two.md"}]' > "$SYNC_TMP/api/.claude/agents"
+    echo '[{"name": "hook.sh"}]' > "$SYNC_TMP/api/.claude/hooks"
+    FALLBACK_DEST="$SYNC_TMP/fallback"
+    git init -q "$FALLBACK_DEST"
+    output=$(cd "$FALLBACK_DEST" && RAW_BASE="http://127.0.0.1:$PORT/src" \
+        API_BASE="http://127.0.0.1:$PORT/api" \
+        bash "$MANAGE_SCRIPT" claude install 2>&1) || true
+    if echo "$output" | grep -q "lists no agents or hooks" && \
+       [[ -f "$FALLBACK_DEST/.claude/agents/two.md" ]] && \
+       [[ -x "$FALLBACK_DEST/.claude/hooks/hook.sh" ]] && \
+       [[ -f "$FALLBACK_DEST/.github/workflows/claude.yml" ]]; then
+        assert "install falls back to per-file download on an incomplete manifest" "pass"
+    else
+        assert "install falls back to per-file download on an incomplete manifest" "fail" "$output"
+    fi
+else
+    echo "  (python3 or curl not installed — skipping)"
+fi
+
+echo
+
 # ── shellcheck ──────────────────────────────────────────────────────
 
 echo "=== shellcheck ==="